@@ -1,11 +1,22 @@
 """FastAPI application entry point."""
 import logging
+from typing import Type
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.routers import health, generation
 from config.settings import Settings
 
+DefaultResponse: Type[JSONResponse]
+try:
+    import orjson  # noqa: F401
+
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +30,7 @@ app = FastAPI(
     title=settings.app_name,
     description=settings.app_description,
     version=settings.app_version,
+    default_response_class=DefaultResponse,
 )
 
 # Configure CORS
@@ -24,10 +24,16 @@ class SummaryStats(BaseModel):
     valid_records: int
     invalid_records: int
     validation_errors: List[ValidationError]
+    validation_errors_by_field: Dict[str, List[ValidationError]] = Field(default_factory=dict)
     parse_errors: List[str]
     processing_time_ms: float
     data_format: DataFormat
 
+    @property
+    def error_counts(self) -> Dict[str, int]:
+        """Number of validation errors for each field that has any."""
+        return {field: len(errors) for field, errors in self.validation_errors_by_field.items()}
+
 
 class ParsingResult(BaseModel):
     """Result of parsing operation."""
@@ -43,3 +49,22 @@ class DataParserConfig(BaseModel):
     validate_on_parse: bool = True
     max_errors: int = 100
     encoding: str = "utf-8"
+
+    @classmethod
+    def build(
+        cls, *, format: DataFormat, schema: Dict[str, Any], **overrides: Any
+    ) -> "DataParserConfig":
+        """
+        Build a config from already-typed values without running validation.
+
+        Fields not given keep their declared defaults.
+
+        Args:
+            format: Data format
+            schema: Schema definition dictionary
+            **overrides: Values for the remaining config fields
+
+        Returns:
+            DataParserConfig
+        """
+        return cls.model_construct(format=format, schema=schema, **overrides)
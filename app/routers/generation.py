@@ -1,11 +1,12 @@
 """LDIF Generation API endpoints."""
+import codecs
 import csv
-import io
 import json
 import logging
-from typing import Optional
+from typing import BinaryIO, Dict, List, Optional
 
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 
 from app.models.generation_models import (
@@ -20,6 +21,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _read_csv_records(upload: BinaryIO) -> List[Dict[str, str]]:
+    """Read CSV records from an uploaded file without buffering the whole body."""
+    # Decode line by line rather than through io.TextIOWrapper: on Python 3.10
+    # the SpooledTemporaryFile behind UploadFile has no readable()/read1().
+    return list(csv.DictReader(codecs.iterdecode(upload, "utf-8")))
+
+
 @router.post("/jobs", response_model=GenerationJob, tags=["generation"])
 async def create_generation_job(request: GenerationRequest) -> GenerationJob:
     """
@@ -82,13 +90,13 @@ async def upload_csv(
         Creation job
     """
     try:
-        content = await file.read()
-        csv_content = content.decode("utf-8")
-
         logger.info(f"Uploaded CSV file: {file.filename}")
 
-        reader = csv.DictReader(io.StringIO(csv_content))
-        data = [row for row in reader]
+        if not await file.read(1):
+            raise HTTPException(status_code=400, detail="CSV file is empty")
+        await file.seek(0)
+
+        data = await run_in_threadpool(_read_csv_records, file.file)
 
         if not data:
             raise HTTPException(status_code=400, detail="CSV file is empty")
@@ -129,11 +137,13 @@ async def upload_json(
     """
     try:
         content = await file.read()
-        json_content = content.decode("utf-8")
 
         logger.info(f"Uploaded JSON file: {file.filename}")
 
-        parsed = json.loads(json_content)
+        if not content.strip():
+            raise HTTPException(status_code=400, detail="JSON file is empty")
+
+        parsed = json.loads(content)
 
         # Handle various JSON structures
         if isinstance(parsed, list):
@@ -252,7 +262,7 @@ async def process_job(job_id: str) -> GenerationResponse:
     logger.info(f"Processing job {job_id}")
 
     # Reconstruct request from job data
-    request = GenerationRequest(data=[], schema_name="user", base_dn="")
+    request = GenerationRequest.model_construct(data=[], schema_name="user", base_dn="")
 
     response = GenerationService.process_generation(job_id, request)
     return response
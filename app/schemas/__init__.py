@@ -6,6 +6,7 @@ from .data_schemas import (
     USER_SCHEMA,
     PRODUCT_SCHEMA,
     TRANSACTION_SCHEMA,
+    PREDEFINED_SCHEMAS,
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "USER_SCHEMA",
     "PRODUCT_SCHEMA",
     "TRANSACTION_SCHEMA",
+    "PREDEFINED_SCHEMAS",
 ]
@@ -1,6 +1,6 @@
 """Schema definitions for data validation."""
 from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, field_validator
 from enum import Enum
 
 
@@ -80,3 +80,7 @@ TRANSACTION_SCHEMA = DataSchema(
         "status": ValidationRule(field_type=FieldType.STRING, required=True, choices=["pending", "completed", "failed"]),
     }
 )
+
+PREDEFINED_SCHEMAS: Dict[str, DataSchema] = {
+    schema.name: schema for schema in (USER_SCHEMA, PRODUCT_SCHEMA, TRANSACTION_SCHEMA)
+}
@@ -10,7 +10,7 @@ from app.models.generation_models import (
     GenerationRequest,
     GenerationResponse,
 )
-from app.schemas.data_schemas import USER_SCHEMA, PRODUCT_SCHEMA, TRANSACTION_SCHEMA
+from app.schemas.data_schemas import PREDEFINED_SCHEMAS
 from app.services.ldif.models import User, LDAPEntry
 from app.services.ldif.generator import LDIFGenerator
 
@@ -26,9 +26,7 @@ class GenerationService:
 
     # Available schemas
     AVAILABLE_SCHEMAS = {
-        "user": USER_SCHEMA.model_dump(),
-        "product": PRODUCT_SCHEMA.model_dump(),
-        "transaction": TRANSACTION_SCHEMA.model_dump(),
+        name: schema.model_dump() for name, schema in PREDEFINED_SCHEMAS.items()
     }
 
     @staticmethod
@@ -0,0 +1,89 @@
+"""LDIF line emitters for LDAP entries."""
+from typing import TYPE_CHECKING, Callable, List, Sequence, cast
+
+from .utils import encode_value, is_safe_string
+
+if TYPE_CHECKING:
+    from .models import LDAPEntry
+
+LDIFEmitter = Callable[["LDAPEntry", List[str]], None]
+
+
+def format_line(name: str, value: str) -> str:
+    """
+    Format a single LDIF line, base64 encoding the value when required.
+
+    Args:
+        name: Attribute name (or "dn")
+        value: Attribute value
+
+    Returns:
+        LDIF line without trailing newline
+    """
+    if is_safe_string(value):
+        return f"{name}: {value}"
+    return f"{name}:: {encode_value(value)}"
+
+
+def emit_entry(entry: "LDAPEntry", out: List[str]) -> None:
+    """
+    Append the LDIF lines of an arbitrary entry to ``out``.
+
+    Args:
+        entry: LDAP entry to emit
+        out: List collecting output lines
+    """
+    out.append(format_line("dn", entry.dn))
+
+    for oc in entry.object_classes:
+        out.append(format_line("objectClass", oc))
+
+    for attr, values in entry.attributes.items():
+        for val in values:
+            out.append(format_line(attr, val))
+
+
+_EMITTER_TEMPLATE = """
+def _ldif_emit(entry, out):
+    append = out.append
+    append(format_line("dn", entry.dn))
+    if entry.object_classes == object_classes:
+{object_class_lines}
+    else:
+        for oc in entry.object_classes:
+            append(format_line("objectClass", oc))
+    for attr, values in entry.attributes.items():
+        for val in values:
+            if is_safe_string(val):
+                append(f"{{attr}}: {{val}}")
+            else:
+                append(f"{{attr}}:: {{encode_value(val)}}")
+"""
+
+
+def build_emitter(object_classes: Sequence[str]) -> LDIFEmitter:
+    """
+    Build an emitter specialized for a fixed list of object classes.
+
+    The objectClass lines are formatted once here and inlined as constants
+    in the generated function. Entries whose object classes were changed
+    after construction fall back to the generic per-value formatting.
+
+    Args:
+        object_classes: Object classes every instance starts with
+
+    Returns:
+        Function appending the LDIF lines of an entry to a list
+    """
+    object_class_lines = "\n".join(
+        f"        append({format_line('objectClass', oc)!r})" for oc in object_classes
+    )
+    source = _EMITTER_TEMPLATE.format(object_class_lines=object_class_lines or "        pass")
+    namespace = {
+        "format_line": format_line,
+        "is_safe_string": is_safe_string,
+        "encode_value": encode_value,
+        "object_classes": list(object_classes),
+    }
+    exec(compile(source, "<ldif-emitter>", "exec"), namespace)
+    return cast(LDIFEmitter, namespace["_ldif_emit"])
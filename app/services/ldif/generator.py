@@ -1,118 +1,67 @@
 """LDIF generation module."""
-import base64
 from typing import List, Union
 from .models import LDAPEntry
-
-
-def is_safe_string(s: str) -> bool:
-    """
-    Check if a string is safe for LDIF without base64 encoding.
-    
-    RFC 2849:
-    SAFE-INIT-CHAR = %x01-09 / %x0B-0C / %x0E-1F / %x21-39 / %x3B / %x3C-7F
-                     ; any value <= 127 decimal except NUL, LF, CR, SPACE, colon, <
-    SAFE-CHAR      = %x01-09 / %x0B-0C / %x0E-7F
-                     ; any value <= 127 decimal except NUL, LF, CR
-    
-    Args:
-        s: String to check
-        
-    Returns:
-        True if the string is safe for LDIF, False otherwise
-    """
-    if not s:
-        return True
-
-    # Check characters
-    for char in s:
-        code = ord(char)
-        if code > 127 or code == 0 or code == 10 or code == 13:
-            return False
-
-    # Check first char
-    first_code = ord(s[0])
-    # Cannot start with space (32), colon (58), or less-than (60)
-    if first_code == 32 or first_code == 58 or first_code == 60:
-        return False
-
-    # Check trailing space
-    if s[-1] == " ":
-        return False
-
-    return True
-
-
-def encode_value(value: str) -> str:
-    """
-    Encode a value using base64 for LDIF.
-    
-    Args:
-        value: The value to encode
-        
-    Returns:
-        Base64 encoded string
-    """
-    encoded_bytes = base64.b64encode(value.encode("utf-8"))
-    return encoded_bytes.decode("ascii")
+from .utils import encode_value, is_safe_string  # noqa: F401  (re-exported)
 
 
 class LDIFGenerator:
     """LDIF format generator."""
     
     @staticmethod
-    def generate(entry: Union[LDAPEntry, List[LDAPEntry]]) -> str:
+    def generate(entry: Union[LDAPEntry, List[LDAPEntry]], validate: bool = True) -> str:
         """
         Generate LDIF output from LDAP entry or entries.
         
         Args:
             entry: Single LDAP entry or list of entries
+            validate: Validate entries before generating. Pass False only
+                when the caller has already validated them.
             
         Returns:
             LDIF formatted string
+            
+        Raises:
+            ValueError: If an entry is invalid
         """
         if isinstance(entry, list):
-            return LDIFGenerator.generate_batch(entry)
-
-        entry.validate()
-
-        lines = []
+            return LDIFGenerator.generate_batch(entry, validate=validate)
 
-        # DN
-        if is_safe_string(entry.dn):
-            lines.append(f"dn: {entry.dn}")
-        else:
-            lines.append(f"dn:: {encode_value(entry.dn)}")
+        if validate:
+            entry.validate()
 
-        # ObjectClasses
-        for oc in entry.object_classes:
-            if is_safe_string(oc):
-                lines.append(f"objectClass: {oc}")
-            else:
-                lines.append(f"objectClass:: {encode_value(oc)}")
-
-        # Attributes
-        for attr, values in entry.attributes.items():
-            for val in values:
-                if is_safe_string(val):
-                    lines.append(f"{attr}: {val}")
-                else:
-                    lines.append(f"{attr}:: {encode_value(val)}")
+        lines: List[str] = []
+        type(entry)._ldif_emit(entry, lines)
 
         return "\n".join(lines)
 
     @staticmethod
-    def generate_batch(entries: List[LDAPEntry]) -> str:
+    def generate_batch(entries: List[LDAPEntry], validate: bool = True) -> str:
         """
         Generate LDIF output from multiple entries.
         
+        All entries are validated up front, so an invalid entry fails the
+        batch before any output is formatted.
+        
         Args:
             entries: List of LDAP entries
+            validate: Validate entries before generating
             
         Returns:
             LDIF formatted string with all entries
+            
+        Raises:
+            ValueError: If an entry is invalid
         """
-        ldif_outputs = []
+        if validate:
+            for entry in entries:
+                entry.validate()
+
+        # Emit every entry into one buffer, with a blank line between
+        # entries, and join once.
+        lines: List[str] = []
         for entry in entries:
-            ldif_outputs.append(LDIFGenerator.generate(entry))
+            if lines:
+                lines.append("")
+            type(entry)._ldif_emit(entry, lines)
 
-        return "\n\n".join(ldif_outputs)
+        return "\n".join(lines)
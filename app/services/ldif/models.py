@@ -1,11 +1,24 @@
 """LDAP model classes for LDIF generation."""
-from typing import List, Dict, Optional
+from typing import ClassVar, List, Dict, Tuple
+from .emitter import LDIFEmitter, build_emitter, emit_entry
 from .utils import escape_dn_value
 from .validator import validate_entry
 
 
 class LDAPEntry:
     """Base LDAP entry class."""
+
+    # Object classes every instance of a subclass starts with. Subclasses that
+    # define this get an LDIF emitter specialized for them at class creation.
+    OBJECT_CLASSES: Tuple[str, ...] = ()
+
+    _ldif_emit: ClassVar[LDIFEmitter] = staticmethod(emit_entry)
+
+    def __init_subclass__(cls, **kwargs):
+        """Build a specialized LDIF emitter for subclasses with fixed object classes."""
+        super().__init_subclass__(**kwargs)
+        if "OBJECT_CLASSES" in cls.__dict__:
+            cls._ldif_emit = staticmethod(build_emitter(cls.OBJECT_CLASSES))
     
     def __init__(
         self,
@@ -54,7 +67,9 @@ class LDAPEntry:
 
 class User(LDAPEntry):
     """LDAP User entry."""
-    
+
+    OBJECT_CLASSES = ("top", "person", "organizationalPerson", "inetOrgPerson")
+
     def __init__(
         self,
         uid: str,
@@ -88,14 +103,16 @@ class User(LDAPEntry):
         super().__init__(
             rdn=f"uid={escape_dn_value(uid)}",
             parent_dn=parent_dn,
-            object_classes=["top", "person", "organizationalPerson", "inetOrgPerson"],
+            object_classes=list(self.OBJECT_CLASSES),
             attributes=attributes,
         )
 
 
 class Group(LDAPEntry):
     """LDAP Group entry."""
-    
+
+    OBJECT_CLASSES = ("top", "groupOfNames")
+
     def __init__(
         self,
         cn: str,
@@ -126,14 +143,16 @@ class Group(LDAPEntry):
         super().__init__(
             rdn=f"cn={escape_dn_value(cn)}",
             parent_dn=parent_dn,
-            object_classes=["top", "groupOfNames"],
+            object_classes=list(self.OBJECT_CLASSES),
             attributes=attributes,
         )
 
 
 class OU(LDAPEntry):
     """LDAP Organizational Unit entry."""
-    
+
+    OBJECT_CLASSES = ("top", "organizationalUnit")
+
     def __init__(
         self,
         name: str,
@@ -161,6 +180,6 @@ class OU(LDAPEntry):
         super().__init__(
             rdn=f"ou={escape_dn_value(name)}",
             parent_dn=parent_dn,
-            object_classes=["top", "organizationalUnit"],
+            object_classes=list(self.OBJECT_CLASSES),
             attributes=attributes,
         )
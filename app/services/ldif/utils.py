@@ -1,4 +1,42 @@
 """LDIF utility functions."""
+import re
+
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+
+_DN_SPECIAL_CHARS = '#,+"\\<>;'
+
+
+def _escape_dn_char(code: int) -> str:
+    """Return the escaped form of a single DN character."""
+    char = chr(code)
+    if char in _DN_SPECIAL_CHARS:
+        return "\\" + char
+    if code < 32 or code > 126:
+        return "".join([f"\\{byte:02x}" for byte in char.encode("utf-8")])
+    return char
+
+
+class _DNEscapeTable(dict):
+    """
+    ``str.translate`` table for DN values.
+    
+    Holds a precomputed entry for every ASCII code point; non-ASCII
+    characters are hex-escaped as UTF-8 bytes on lookup.
+    """
+
+    def __missing__(self, code: int) -> str:
+        return _escape_dn_char(code)
+
+
+_DN_ESCAPE_TABLE = _DNEscapeTable((code, _escape_dn_char(code)) for code in range(128))
+
+# Matches any ASCII character escape_dn_value would change, including leading
+# and trailing spaces. Non-ASCII characters always need escaping.
+_DN_NEEDS_ESCAPE = re.compile(r'[#,+"\\<>;\x00-\x1f\x7f]|^ | \Z')
 
 
 def escape_dn_value(value: str) -> str:
@@ -11,22 +49,19 @@ def escape_dn_value(value: str) -> str:
     Returns:
         The escaped DN value
     """
-    escaped = ""
-    for i, char in enumerate(value):
-        # Characters that need escaping
-        if char in ("#", ",", "+", '"', "\\", "<", ">", ";"):
-            escaped += "\\" + char
-        elif ord(char) < 32 or ord(char) > 126:
-            escaped += "".join([f"\\{byte:02x}" for byte in char.encode("utf-8")])
-        else:
-            escaped += char
-    
-    # Handle leading/trailing spaces
-    if escaped and escaped[0] == " ":
-        escaped = "\\ " + escaped[1:]
-    if escaped and escaped[-1] == " ":
+    # isascii() is a constant-time flag check on str objects.
+    if value.isascii() and not _DN_NEEDS_ESCAPE.search(value):
+        return value
+
+    escaped = value.translate(_DN_ESCAPE_TABLE)
+
+    # Handle leading/trailing spaces. The value is non-empty here since the
+    # empty string never needs escaping.
+    if value[0] == " ":
+        escaped = "\\" + escaped
+    if value[-1] == " " and len(value) > 1:
         escaped = escaped[:-1] + "\\ "
-    
+
     return escaped
 
 
@@ -44,3 +79,42 @@ def is_printable_string(value: str) -> bool:
             return False
     
     return True
+
+
+# Matches anything that keeps a value from being an RFC 2849 SAFE-STRING:
+# a character outside SAFE-CHAR, an unsafe initial character, or a trailing
+# space.
+_UNSAFE_LDIF_VALUE = re.compile(r"[^\x01-\x09\x0b\x0c\x0e-\x7f]|^[ :<]| \Z")
+
+
+def is_safe_string(s: str) -> bool:
+    """
+    Check if a string is safe for LDIF without base64 encoding.
+    
+    RFC 2849:
+    SAFE-INIT-CHAR = %x01-09 / %x0B-0C / %x0E-1F / %x21-39 / %x3B / %x3C-7F
+                     ; any value <= 127 decimal except NUL, LF, CR, SPACE, colon, <
+    SAFE-CHAR      = %x01-09 / %x0B-0C / %x0E-7F
+                     ; any value <= 127 decimal except NUL, LF, CR
+    
+    Args:
+        s: String to check
+        
+    Returns:
+        True if the string is safe for LDIF, False otherwise
+    """
+    return _UNSAFE_LDIF_VALUE.search(s) is None
+
+
+def encode_value(value: str) -> str:
+    """
+    Encode a value using base64 for LDIF.
+    
+    Args:
+        value: The value to encode
+        
+    Returns:
+        Base64 encoded string
+    """
+    encoded_bytes: bytes = _b64encode(value.encode("utf-8"))
+    return encoded_bytes.decode("ascii")
@@ -6,6 +6,14 @@ if TYPE_CHECKING:
     from .models import LDAPEntry
 
 
+def _count_backslashes_before(s: str, end: int) -> int:
+    """Count the consecutive backslashes immediately before position ``end``."""
+    count = 0
+    while end > count and s[end - count - 1] == '\\':
+        count += 1
+    return count
+
+
 def validate_dn(dn: str) -> bool:
     """
     Validates a Distinguished Name (DN) string against a simplified RFC 4514 pattern.
@@ -14,29 +22,22 @@ def validate_dn(dn: str) -> bool:
     if not dn:
         return False
     
-    # We need to split by comma, but respect escapes.
+    # We need to split by comma, but respect escapes. A comma is escaped
+    # when preceded by an odd number of backslashes.
     parts = []
-    current_part = ""
-    escaped = False
-    
-    for char in dn:
-        if escaped:
-            current_part += char
-            escaped = False
-        elif char == '\\':
-            escaped = True
-            current_part += char
-        elif char == ',':
-            parts.append(current_part)
-            current_part = ""
-        else:
-            current_part += char
+    start = 0
+    comma = dn.find(',')
+    while comma != -1:
+        if _count_backslashes_before(dn, comma) % 2 == 0:
+            parts.append(dn[start:comma])
+            start = comma + 1
+        comma = dn.find(',', comma + 1)
             
-    if escaped:
+    if _count_backslashes_before(dn, len(dn)) % 2:
         # DN ended with a single backslash
         return False
         
-    parts.append(current_part)
+    parts.append(dn[start:])
     
     # Pattern: key=value
     part_pattern = r'^[a-zA-Z0-9-]+=.*$' 
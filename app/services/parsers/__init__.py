@@ -1,12 +1,22 @@
 """Data parser services package."""
-from .data_parser import DataParserService
-from .csv_parser import parse_csv_string, parse_csv_file
-from .json_parser import parse_json_string, parse_json_file
+from .data_parser import DataParserService, get_parser_service
+from .csv_parser import compile_csv_fields, parse_csv_string, parse_csv_bytes, parse_csv_file
+from .json_parser import (
+    compile_json_fields,
+    parse_json_string,
+    parse_json_bytes,
+    parse_json_file,
+)
 
 __all__ = [
     "DataParserService",
+    "get_parser_service",
+    "compile_csv_fields",
     "parse_csv_string",
+    "parse_csv_bytes",
     "parse_csv_file",
+    "compile_json_fields",
     "parse_json_string",
+    "parse_json_bytes",
     "parse_json_file",
 ]
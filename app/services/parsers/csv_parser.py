@@ -2,62 +2,170 @@
 import csv
 import io
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Any, List, Optional
 from app.models.data_models import (
     DataFormat,
-    ValidationError,
     SummaryStats,
     ParsingResult,
-    DataParserConfig,
+    ValidationError,
 )
+from .validation import (
+    TRUE_STRINGS,
+    CompiledFields,
+    FieldConverter,
+    compile_fields,
+    validate_columns,
+)
+
 
+def _convert_integer(value: str) -> tuple[Any, Optional[str]]:
+    """Convert a CSV cell to an integer."""
+    try:
+        return int(value), None
+    except (ValueError, TypeError) as e:
+        return None, f"Type conversion error: {str(e)}"
 
-def _convert_value(value: str, field_type: str) -> tuple[Any, Optional[str]]:
-    """Convert a value to the appropriate type."""
-    if not value and value != "0":
-        return None, None
 
+def _convert_float(value: str) -> tuple[Any, Optional[str]]:
+    """Convert a CSV cell to a float."""
     try:
-        if field_type == "integer":
-            return int(value), None
-        elif field_type == "float":
-            return float(value), None
-        elif field_type == "boolean":
-            return value.lower() in ("true", "1", "yes", "on"), None
-        elif field_type == "date":
-            return value, None
-        elif field_type == "email":
-            if "@" in value and "." in value.split("@")[1]:
-                return value, None
-            return None, f"Invalid email format: {value}"
-        elif field_type == "phone":
-            return value, None
-        else:
-            return value, None
+        return float(value), None
     except (ValueError, TypeError) as e:
         return None, f"Type conversion error: {str(e)}"
 
 
-def parse_csv_string(content: str, schema: Dict[str, Any]) -> ParsingResult:
+def _convert_boolean(value: str) -> tuple[Any, Optional[str]]:
+    """Convert a CSV cell to a boolean."""
+    return value.lower() in TRUE_STRINGS, None
+
+
+def _convert_email(value: str) -> tuple[Any, Optional[str]]:
+    """Check that a CSV cell looks like an email address."""
+    if "@" in value and "." in value.split("@")[1]:
+        return value, None
+    return None, f"Invalid email format: {value}"
+
+
+def _keep_value(value: str) -> tuple[Any, Optional[str]]:
+    """Keep a CSV cell as a string."""
+    return value, None
+
+
+# Date, phone and unknown field types are kept as strings.
+_CONVERTERS: Dict[str, FieldConverter] = {
+    "integer": _convert_integer,
+    "float": _convert_float,
+    "boolean": _convert_boolean,
+    "email": _convert_email,
+}
+
+
+def _is_missing(value: Optional[str]) -> bool:
+    """Check if a CSV cell is empty."""
+    return not value
+
+
+def compile_csv_fields(schema: Dict[str, Any]) -> CompiledFields:
+    """
+    Compile a schema's fields for CSV parsing.
+    
+    Args:
+        schema: Schema definition dictionary
+        
+    Returns:
+        Compiled fields to pass to the CSV parse functions
+    """
+    return compile_fields(schema.get("fields", {}), _CONVERTERS, _keep_value)
+
+
+def parse_csv_string(
+    content: str,
+    schema: Dict[str, Any],
+    fields: Optional[CompiledFields] = None,
+    validate: bool = True,
+) -> ParsingResult:
     """
     Parse CSV content from a string.
     
     Args:
         content: CSV content as string
         schema: Schema definition dictionary
+        fields: Fields compiled from ``schema`` with compile_csv_fields, to
+            avoid compiling them on every call
+        validate: Validate and convert records against the schema. When
+            False, records are returned as read, without type conversion.
         
     Returns:
         ParsingResult with parsed data and statistics
     """
+    if fields is None:
+        fields = compile_csv_fields(schema)
+    return _parse_csv_lines(io.StringIO(content), fields, validate)
+
+
+def parse_csv_bytes(
+    content: bytes,
+    schema: Dict[str, Any],
+    fields: Optional[CompiledFields] = None,
+    validate: bool = True,
+) -> ParsingResult:
+    """
+    Parse UTF-8 encoded CSV content.
+    
+    The bytes are decoded incrementally while the rows are read instead of
+    being decoded into one string up front.
+    
+    Args:
+        content: CSV content as UTF-8 bytes
+        schema: Schema definition dictionary
+        fields: Fields compiled from ``schema`` with compile_csv_fields, to
+            avoid compiling them on every call
+        validate: Validate and convert records against the schema. When
+            False, records are returned as read, without type conversion.
+        
+    Returns:
+        ParsingResult with parsed data and statistics
+    """
+    if fields is None:
+        fields = compile_csv_fields(schema)
+    lines = io.TextIOWrapper(io.BytesIO(content), encoding="utf-8", newline="")
+    try:
+        return _parse_csv_lines(lines, fields, validate)
+    except UnicodeDecodeError as e:
+        return ParsingResult(
+            data=[],
+            summary=SummaryStats(
+                total_records=0,
+                valid_records=0,
+                invalid_records=0,
+                validation_errors=[],
+                parse_errors=[f"CSV parsing error: {str(e)}"],
+                processing_time_ms=0,
+                data_format=DataFormat.CSV,
+            ),
+            errors=[],
+        )
+
+
+def _parse_csv_lines(
+    lines: Iterable[str], fields: CompiledFields, validate: bool = True
+) -> ParsingResult:
+    """
+    Parse CSV lines into a ParsingResult.
+
+    Decoding errors raised while reading ``lines`` are propagated, so each
+    caller can report undecodable input in its own way.
+    """
     start_time = time.time()
-    data = []
+    data: List[Dict[str, Any]] = []
     errors = []
-    validation_errors = []
+    validation_errors: List[ValidationError] = []
+    validation_errors_by_field: Dict[str, List[ValidationError]] = {}
     parse_errors = []
 
     try:
         # Parse CSV
-        reader = csv.DictReader(io.StringIO(content))
+        reader = csv.DictReader(lines)
         if not reader.fieldnames:
             parse_errors.append("No headers found in CSV")
             return ParsingResult(
@@ -74,51 +182,23 @@ def parse_csv_string(content: str, schema: Dict[str, Any]) -> ParsingResult:
                 errors=errors,
             )
 
-        fields = schema.get("fields", {})
-        row_number = 1
-
-        for row in reader:
-            record = {}
-            row_errors = []
-
-            for field_name, field_def in fields.items():
-                value = row.get(field_name, "")
-                field_type = field_def.get("field_type", "string")
-                required = field_def.get("required", False)
-
-                if not value:
-                    if required:
-                        row_errors.append(
-                            ValidationError(
-                                field=field_name,
-                                message="Required field is missing",
-                                value=value,
-                                row_number=row_number,
-                            )
-                        )
-                    elif "default" in field_def:
-                        record[field_name] = field_def["default"]
-                else:
-                    converted, error = _convert_value(value, field_type)
-                    if error:
-                        row_errors.append(
-                            ValidationError(
-                                field=field_name,
-                                message=error,
-                                value=value,
-                                row_number=row_number,
-                            )
-                        )
-                    else:
-                        record[field_name] = converted
-
-            if row_errors:
-                validation_errors.extend(row_errors)
-            else:
-                data.append(record)
-
-            row_number += 1
+        rows = list(reader)
+        if validate:
+            data, validation_errors, validation_errors_by_field = validate_columns(
+                rows,
+                range(1, len(rows) + 1),
+                fields,
+                _is_missing,
+                missing_value="",
+            )
+        else:
+            # Keep rows as read, dropping cells beyond the header.
+            for row in rows:
+                row.pop(None, None)
+            data = rows
 
+    except UnicodeDecodeError:
+        raise
     except Exception as e:
         parse_errors.append(f"CSV parsing error: {str(e)}")
 
@@ -134,6 +214,7 @@ def parse_csv_string(content: str, schema: Dict[str, Any]) -> ParsingResult:
             valid_records=valid,
             invalid_records=invalid,
             validation_errors=validation_errors,
+            validation_errors_by_field=validation_errors_by_field,
             parse_errors=parse_errors,
             processing_time_ms=processing_time,
             data_format=DataFormat.CSV,
@@ -142,21 +223,33 @@ def parse_csv_string(content: str, schema: Dict[str, Any]) -> ParsingResult:
     )
 
 
-async def parse_csv_file(filepath: str, schema: Dict[str, Any]) -> ParsingResult:
+async def parse_csv_file(
+    filepath: str,
+    schema: Dict[str, Any],
+    fields: Optional[CompiledFields] = None,
+    validate: bool = True,
+) -> ParsingResult:
     """
     Parse CSV content from a file.
     
     Args:
         filepath: Path to CSV file
         schema: Schema definition dictionary
+        fields: Fields compiled from ``schema`` with compile_csv_fields, to
+            avoid compiling them on every call
+        validate: Validate and convert records against the schema. When
+            False, records are returned as read, without type conversion.
         
     Returns:
         ParsingResult with parsed data and statistics
     """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-        return parse_csv_string(content, schema)
+        if fields is None:
+            fields = compile_csv_fields(schema)
+        # Rows are decoded and read from the file as the parser consumes
+        # them, so the raw file is never held in memory as one object.
+        with open(filepath, encoding="utf-8", newline="") as lines:
+            return _parse_csv_lines(lines, fields, validate)
     except FileNotFoundError:
         return ParsingResult(
             data=[],
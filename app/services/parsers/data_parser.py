@@ -1,12 +1,27 @@
 """Unified data parser service."""
-from typing import Dict, List, Any
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List
 from app.models.data_models import (
     DataParserConfig,
     ParsingResult,
     DataFormat,
 )
-from .csv_parser import parse_csv_string, parse_csv_file
-from .json_parser import parse_json_string, parse_json_file
+from app.schemas.data_schemas import PREDEFINED_SCHEMAS
+from .csv_parser import compile_csv_fields, parse_csv_string, parse_csv_bytes, parse_csv_file
+from .json_parser import (
+    compile_json_fields,
+    parse_json_string,
+    parse_json_bytes,
+    parse_json_file,
+)
+
+# Below this combined size, files are parsed in the calling process; worker
+# round trips would cost more than the parsing itself.
+PARALLEL_MIN_TOTAL_BYTES = 1024 * 1024
 
 
 class DataParserService:
@@ -20,6 +35,13 @@ class DataParserService:
             config: Parser configuration
         """
         self.config = config
+        # Resolve the schema's field converters once for every parse call.
+        if config.format == DataFormat.CSV:
+            self._fields = compile_csv_fields(config.schema)
+        elif config.format == DataFormat.JSON:
+            self._fields = compile_json_fields(config.schema)
+        else:
+            self._fields = None
 
     def parse_content(self, content: str) -> ParsingResult:
         """
@@ -32,9 +54,34 @@ class DataParserService:
             ParsingResult with parsed data
         """
         if self.config.format == DataFormat.CSV:
-            return parse_csv_string(content, self.config.schema)
+            return parse_csv_string(
+                content, self.config.schema, self._fields, self.config.validate_on_parse
+            )
+        elif self.config.format == DataFormat.JSON:
+            return parse_json_string(
+                content, self.config.schema, self._fields, self.config.validate_on_parse
+            )
+        else:
+            raise ValueError(f"Unsupported data format: {self.config.format}")
+
+    def parse_bytes(self, content: bytes) -> ParsingResult:
+        """
+        Parse data from UTF-8 encoded bytes, such as an uploaded file body.
+        
+        Args:
+            content: Data content as UTF-8 bytes
+            
+        Returns:
+            ParsingResult with parsed data
+        """
+        if self.config.format == DataFormat.CSV:
+            return parse_csv_bytes(
+                content, self.config.schema, self._fields, self.config.validate_on_parse
+            )
         elif self.config.format == DataFormat.JSON:
-            return parse_json_string(content, self.config.schema)
+            return parse_json_bytes(
+                content, self.config.schema, self._fields, self.config.validate_on_parse
+            )
         else:
             raise ValueError(f"Unsupported data format: {self.config.format}")
 
@@ -49,8 +96,94 @@ class DataParserService:
             ParsingResult with parsed data
         """
         if self.config.format == DataFormat.CSV:
-            return await parse_csv_file(filepath, self.config.schema)
+            return await parse_csv_file(
+                filepath, self.config.schema, self._fields, self.config.validate_on_parse
+            )
         elif self.config.format == DataFormat.JSON:
-            return await parse_json_file(filepath, self.config.schema)
+            return await parse_json_file(
+                filepath, self.config.schema, self._fields, self.config.validate_on_parse
+            )
         else:
             raise ValueError(f"Unsupported data format: {self.config.format}")
+
+    async def parse_files(self, filepaths: List[str]) -> List[ParsingResult]:
+        """
+        Parse several files, in parallel worker processes when they are large enough.
+        
+        Files are parsed one after another in the calling process when there
+        is only one, or when together they are smaller than
+        PARALLEL_MIN_TOTAL_BYTES.
+        
+        Args:
+            filepaths: Paths to data files
+            
+        Returns:
+            ParsingResult for each file, in the order given
+        """
+        if len(filepaths) <= 1 or _total_size(filepaths) < PARALLEL_MIN_TOTAL_BYTES:
+            return [await self.parse_file(filepath) for filepath in filepaths]
+
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _parse_file_in_worker, self.config, filepath)
+                for filepath in filepaths
+            )
+        )
+
+
+def _total_size(filepaths: List[str]) -> int:
+    """Sum the sizes of the files that exist."""
+    total = 0
+    for filepath in filepaths:
+        try:
+            total += os.path.getsize(filepath)
+        except OSError:
+            pass
+    return total
+
+
+@lru_cache(maxsize=None)
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the worker pool shared by all parse_files calls.
+    
+    The pool is created on first use and kept for the life of the process,
+    so no call pays for starting workers or blocks the event loop waiting
+    for them to shut down. Workers are spawned rather than forked, since the
+    server process may already be running threads.
+    """
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+def _parse_file_in_worker(config: DataParserConfig, filepath: str) -> ParsingResult:
+    """Parse one file in a worker process, rebuilding the service from its config."""
+    return asyncio.run(DataParserService(config).parse_file(filepath))
+
+
+@lru_cache(maxsize=None)
+def get_parser_service(schema_name: str, data_format: DataFormat) -> DataParserService:
+    """
+    Get the shared parser service for a predefined schema and format.
+    
+    Services are built once per (schema, format) pair and reused, so the
+    schema is only serialized and validated into a config on first use.
+    Callers must not mutate the returned service's config.
+    
+    Args:
+        schema_name: Name of a predefined schema
+        data_format: Data format to parse
+        
+    Returns:
+        Cached DataParserService
+        
+    Raises:
+        ValueError: If the schema is not predefined
+    """
+    schema = PREDEFINED_SCHEMAS.get(schema_name)
+    if schema is None:
+        raise ValueError(f"Schema '{schema_name}' not found")
+
+    config = DataParserConfig.build(format=data_format, schema=schema.model_dump())
+    return DataParserService(config)
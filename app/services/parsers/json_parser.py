@@ -1,15 +1,34 @@
 """JSON data parser."""
 import json
+import mmap
+import os
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from app.models.data_models import (
     DataFormat,
-    ValidationError,
     SummaryStats,
     ParsingResult,
-    DataParserConfig,
+    ValidationError,
+)
+from .validation import (
+    TRUE_STRINGS,
+    CompiledFields,
+    FieldConverter,
+    compile_fields,
+    validate_columns,
 )
 
+try:
+    from orjson import loads as _json_loads
+
+    # orjson parses any buffer, so large files can be parsed straight from a
+    # memory map instead of being copied into a bytes object first.
+    _MMAP_MIN_SIZE: Optional[int] = 64 * 1024
+except ImportError:
+    from json import loads as _json_loads
+
+    _MMAP_MIN_SIZE = None
+
 
 def _extract_records(data: Any) -> List[Dict[str, Any]]:
     """Extract records from various JSON structures."""
@@ -27,108 +46,169 @@ def _extract_records(data: Any) -> List[Dict[str, Any]]:
     return []
 
 
-def _convert_value(value: Any, field_type: str) -> tuple[Any, Optional[str]]:
-    """Convert a value to the appropriate type."""
-    if value is None:
-        return None, None
+def _convert_integer(value: Any) -> tuple[Any, Optional[str]]:
+    """Convert a JSON value to an integer."""
+    # Most integer fields already decode as ints; bools are not matched here
+    # and still go through int().
+    if type(value) is int:
+        return value, None
+    try:
+        return int(value), None
+    except (ValueError, TypeError, AttributeError) as e:
+        return None, f"Type conversion error: {str(e)}"
 
+
+def _convert_float(value: Any) -> tuple[Any, Optional[str]]:
+    """Convert a JSON value to a float."""
     try:
-        if field_type == "integer":
-            return int(value), None
-        elif field_type == "float":
-            return float(value), None
-        elif field_type == "boolean":
-            if isinstance(value, bool):
-                return value, None
-            if isinstance(value, str):
-                return value.lower() in ("true", "1", "yes", "on"), None
-            return bool(value), None
-        elif field_type == "date":
-            return str(value), None
-        elif field_type == "email":
-            value_str = str(value)
-            if "@" in value_str and "." in value_str.split("@")[1]:
-                return value_str, None
-            return None, f"Invalid email format: {value}"
-        elif field_type == "phone":
-            return str(value), None
-        else:
-            return value, None
+        return float(value), None
     except (ValueError, TypeError, AttributeError) as e:
         return None, f"Type conversion error: {str(e)}"
 
 
-def parse_json_string(content: str, schema: Dict[str, Any]) -> ParsingResult:
+def _convert_boolean(value: Any) -> tuple[Any, Optional[str]]:
+    """Convert a JSON value to a boolean."""
+    if isinstance(value, bool):
+        return value, None
+    if isinstance(value, str):
+        return value.lower() in TRUE_STRINGS, None
+    return bool(value), None
+
+
+def _convert_email(value: Any) -> tuple[Any, Optional[str]]:
+    """Check that a JSON value looks like an email address."""
+    value_str = str(value)
+    if "@" in value_str and "." in value_str.split("@")[1]:
+        return value_str, None
+    return None, f"Invalid email format: {value}"
+
+
+def _convert_string(value: Any) -> tuple[Any, Optional[str]]:
+    """Convert a JSON value to a string."""
+    return str(value), None
+
+
+def _keep_value(value: Any) -> tuple[Any, Optional[str]]:
+    """Keep a JSON value unchanged."""
+    return value, None
+
+
+# String and unknown field types are kept unchanged.
+_CONVERTERS: Dict[str, FieldConverter] = {
+    "integer": _convert_integer,
+    "float": _convert_float,
+    "boolean": _convert_boolean,
+    "date": _convert_string,
+    "email": _convert_email,
+    "phone": _convert_string,
+}
+
+
+def _is_missing(value: Any) -> bool:
+    """Check if a JSON value is absent."""
+    return value is None
+
+
+def compile_json_fields(schema: Dict[str, Any]) -> CompiledFields:
+    """
+    Compile a schema's fields for JSON parsing.
+    
+    Args:
+        schema: Schema definition dictionary
+        
+    Returns:
+        Compiled fields to pass to the JSON parse functions
+    """
+    return compile_fields(schema.get("fields", {}), _CONVERTERS, _keep_value)
+
+
+def parse_json_string(
+    content: str,
+    schema: Dict[str, Any],
+    fields: Optional[CompiledFields] = None,
+    validate: bool = True,
+) -> ParsingResult:
     """
     Parse JSON content from a string.
     
     Args:
         content: JSON content as string
         schema: Schema definition dictionary
+        fields: Fields compiled from ``schema`` with compile_json_fields, to
+            avoid compiling them on every call
+        validate: Validate and convert records against the schema. When
+            False, records are returned as read, without type conversion.
         
     Returns:
         ParsingResult with parsed data and statistics
     """
+    if fields is None:
+        fields = compile_json_fields(schema)
+    return _parse_json(content, fields, validate)
+
+
+def parse_json_bytes(
+    content: bytes,
+    schema: Dict[str, Any],
+    fields: Optional[CompiledFields] = None,
+    validate: bool = True,
+) -> ParsingResult:
+    """
+    Parse UTF-8 encoded JSON content.
+    
+    The bytes are handed to the JSON decoder directly, without decoding
+    them to a string first.
+    
+    Args:
+        content: JSON content as UTF-8 bytes
+        schema: Schema definition dictionary
+        fields: Fields compiled from ``schema`` with compile_json_fields, to
+            avoid compiling them on every call
+        validate: Validate and convert records against the schema. When
+            False, records are returned as read, without type conversion.
+        
+    Returns:
+        ParsingResult with parsed data and statistics
+    """
+    if fields is None:
+        fields = compile_json_fields(schema)
+    return _parse_json(content, fields, validate)
+
+
+def _parse_json(
+    content: Union[str, bytes, memoryview], fields: CompiledFields, validate: bool = True
+) -> ParsingResult:
+    """Parse JSON text or bytes into a ParsingResult."""
     start_time = time.time()
-    data = []
+    data: List[Dict[str, Any]] = []
     errors = []
-    validation_errors = []
+    validation_errors: List[ValidationError] = []
+    validation_errors_by_field: Dict[str, List[ValidationError]] = {}
     parse_errors = []
 
     try:
         # Parse JSON
-        parsed_json = json.loads(content)
+        parsed_json = _json_loads(content)
         records = _extract_records(parsed_json)
 
-        fields = schema.get("fields", {})
-        row_number = 1
-
-        for record_data in records:
+        rows = []
+        row_numbers = []
+        for row_number, record_data in enumerate(records, 1):
             if not isinstance(record_data, dict):
                 parse_errors.append(f"Invalid record type at row {row_number}: expected dict")
-                row_number += 1
                 continue
+            rows.append(record_data)
+            row_numbers.append(row_number)
 
-            record = {}
-            row_errors = []
-
-            for field_name, field_def in fields.items():
-                value = record_data.get(field_name)
-                field_type = field_def.get("field_type", "string")
-                required = field_def.get("required", False)
-
-                if value is None:
-                    if required:
-                        row_errors.append(
-                            ValidationError(
-                                field=field_name,
-                                message="Required field is missing",
-                                value=value,
-                                row_number=row_number,
-                            )
-                        )
-                    elif "default" in field_def:
-                        record[field_name] = field_def["default"]
-                else:
-                    converted, error = _convert_value(value, field_type)
-                    if error:
-                        row_errors.append(
-                            ValidationError(
-                                field=field_name,
-                                message=error,
-                                value=value,
-                                row_number=row_number,
-                            )
-                        )
-                    else:
-                        record[field_name] = converted
-
-            if row_errors:
-                validation_errors.extend(row_errors)
-            else:
-                data.append(record)
-
-            row_number += 1
+        if validate:
+            data, validation_errors, validation_errors_by_field = validate_columns(
+                rows,
+                row_numbers,
+                fields,
+                _is_missing,
+            )
+        else:
+            data = rows
 
     except json.JSONDecodeError as e:
         parse_errors.append(f"Invalid JSON: {str(e)}")
@@ -147,6 +227,7 @@ def parse_json_string(content: str, schema: Dict[str, Any]) -> ParsingResult:
             valid_records=valid,
             invalid_records=invalid,
             validation_errors=validation_errors,
+            validation_errors_by_field=validation_errors_by_field,
             parse_errors=parse_errors,
             processing_time_ms=processing_time,
             data_format=DataFormat.JSON,
@@ -155,21 +236,36 @@ def parse_json_string(content: str, schema: Dict[str, Any]) -> ParsingResult:
     )
 
 
-async def parse_json_file(filepath: str, schema: Dict[str, Any]) -> ParsingResult:
+async def parse_json_file(
+    filepath: str,
+    schema: Dict[str, Any],
+    fields: Optional[CompiledFields] = None,
+    validate: bool = True,
+) -> ParsingResult:
     """
     Parse JSON content from a file.
     
     Args:
         filepath: Path to JSON file
         schema: Schema definition dictionary
+        fields: Fields compiled from ``schema`` with compile_json_fields, to
+            avoid compiling them on every call
+        validate: Validate and convert records against the schema. When
+            False, records are returned as read, without type conversion.
         
     Returns:
         ParsingResult with parsed data and statistics
     """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-        return parse_json_string(content, schema)
+        if fields is None:
+            fields = compile_json_fields(schema)
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if _MMAP_MIN_SIZE is None or size < _MMAP_MIN_SIZE:
+                return _parse_json(f.read(), fields, validate)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return _parse_json(view, fields, validate)
     except FileNotFoundError:
         return ParsingResult(
             data=[],
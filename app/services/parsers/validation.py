@@ -0,0 +1,123 @@
+"""Record validation shared by the CSV and JSON parsers."""
+import sys
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+from app.models.data_models import ValidationError
+
+FieldConverter = Callable[[Any], Tuple[Any, Optional[str]]]
+
+# Lower-cased strings converted to True for boolean fields.
+TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+
+
+class CompiledField(NamedTuple):
+    """A schema field with its converter resolved ahead of parsing."""
+
+    name: str
+    convert: FieldConverter
+    required: bool
+    has_default: bool
+    default: Any
+
+
+CompiledFields = Tuple[CompiledField, ...]
+
+
+def compile_fields(
+    fields: Dict[str, Any],
+    converters: Mapping[str, FieldConverter],
+    default_converter: FieldConverter,
+) -> CompiledFields:
+    """
+    Resolve each schema field's converter and settings once.
+
+    Field names are interned, so the output records of every parse share
+    the same key objects.
+
+    Args:
+        fields: Schema field definitions
+        converters: Converter for each field type
+        default_converter: Converter for field types not in ``converters``
+
+    Returns:
+        Compiled fields in schema order
+    """
+    return tuple(
+        CompiledField(
+            name=sys.intern(field_name),
+            convert=converters.get(field_def.get("field_type", "string"), default_converter),
+            required=field_def.get("required", False),
+            has_default="default" in field_def,
+            default=field_def.get("default"),
+        )
+        for field_name, field_def in fields.items()
+    )
+
+
+def validate_columns(
+    rows: Sequence[Dict[str, Any]],
+    row_numbers: Sequence[int],
+    fields: CompiledFields,
+    is_missing: Callable[[Any], bool],
+    missing_value: Any = None,
+) -> Tuple[List[Dict[str, Any]], List[ValidationError], Dict[str, List[ValidationError]]]:
+    """
+    Validate and convert records one schema field at a time.
+
+    Each field's column is extracted in a single pass and checked against
+    that field's definition, so the definition is read once per field rather
+    than once per row. Rows with any error are left out of the returned data.
+
+    Args:
+        rows: Raw records
+        row_numbers: Row number reported for each record
+        fields: Compiled schema fields
+        is_missing: Predicate for values treated as absent
+        missing_value: Value used for fields absent from a record
+
+    Returns:
+        Tuple of valid converted records, validation errors in row order,
+        and the same errors grouped by field
+    """
+    records: List[Dict[str, Any]] = [{} for _ in rows]
+    errors_by_row: Dict[int, List[ValidationError]] = {}
+    errors_by_field: Dict[str, List[ValidationError]] = {}
+
+    for field_name, convert, required, has_default, default in fields:
+        field_errors: List[ValidationError] = []
+        column = [row.get(field_name, missing_value) for row in rows]
+        for index, value in enumerate(column):
+            if is_missing(value):
+                if required:
+                    error = ValidationError(
+                        field=field_name,
+                        message="Required field is missing",
+                        value=value,
+                        row_number=row_numbers[index],
+                    )
+                    errors_by_row.setdefault(index, []).append(error)
+                    field_errors.append(error)
+                elif has_default:
+                    records[index][field_name] = default
+                continue
+
+            converted, message = convert(value)
+            if message:
+                error = ValidationError(
+                    field=field_name,
+                    message=message,
+                    value=value,
+                    row_number=row_numbers[index],
+                )
+                errors_by_row.setdefault(index, []).append(error)
+                field_errors.append(error)
+            else:
+                records[index][field_name] = converted
+
+        if field_errors:
+            errors_by_field[field_name] = field_errors
+
+    data = [record for index, record in enumerate(records) if index not in errors_by_row]
+    validation_errors = [
+        error for index in sorted(errors_by_row) for error in errors_by_row[index]
+    ]
+    return data, validation_errors, errors_by_field
@@ -1,11 +1,61 @@
 """Pytest configuration and fixtures."""
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
+from app.models.data_models import DataFormat
+from app.services.ldif.generator import LDIFGenerator
+from app.services.parsers import get_parser_service
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Provide one event loop for the whole session so async fixtures can be shared."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Provide an in-process async client for the FastAPI application."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def parser_services():
+    """Provide shared parser services for the user schema, keyed by format."""
+    return {
+        "csv_user": get_parser_service("user", DataFormat.CSV),
+        "json_user": get_parser_service("user", DataFormat.JSON),
+    }
+
+
+def _entry_key(entry):
+    """Build a hashable key from the content of an LDAP entry or list of entries."""
+    if isinstance(entry, list):
+        return tuple(_entry_key(item) for item in entry)
+    return (
+        type(entry).__name__,
+        entry.dn,
+        tuple(entry.object_classes),
+        tuple((name, tuple(values)) for name, values in entry.attributes.items()),
+    )
+
+
+@pytest.fixture(scope="session")
+def render():
+    """Generate LDIF once per distinct entry content and reuse it across tests."""
+    cache = {}
 
+    def _render(entry):
+        key = _entry_key(entry)
+        if key not in cache:
+            cache[key] = LDIFGenerator.generate(entry)
+        return cache[key]
 
-@pytest.fixture
-def client():
-    """Provide a test client for the FastAPI application."""
-    return TestClient(app)
+    return _render
@@ -0,0 +1,314 @@
+"""Tests for the CSV/JSON data parser services."""
+import pytest
+
+from app.models.data_models import DataFormat, DataParserConfig
+from app.schemas.data_schemas import USER_SCHEMA
+from app.services.parsers import (
+    DataParserService,
+    compile_json_fields,
+    get_parser_service,
+    parse_json_string,
+)
+from app.services.parsers import data_parser
+
+VALID_USER_CSV = (
+    "id,name,email,age,active\n"
+    "1,John Doe,john@example.com,30,true\n"
+    "2,Jane Smith,jane@example.com,25,false\n"
+)
+
+INVALID_USER_CSV = (
+    "id,name,email,age,active\n"
+    "1,John Doe,john@example.com,30,true\n"
+    "abc,Bad Id,bad@example.com,20,true\n"
+    "3,,missing@example.com,40,true\n"
+    "4,Bad Email,not-an-email,50,true\n"
+)
+
+BOOLEAN_USER_CSV = (
+    "id,name,email,active\n"
+    "1,A,a@example.com,True\n"
+    "2,B,b@example.com,FALSE\n"
+    "3,C,c@example.com,1\n"
+    "4,D,d@example.com,0\n"
+    "5,E,e@example.com,\n"
+)
+
+VALID_USER_JSON = """[
+    {"id": 1, "name": "John Doe", "email": "john@example.com", "age": 30},
+    {"id": "2", "name": "Jane Smith", "email": "jane@example.com", "active": false}
+]"""
+
+
+@pytest.fixture(scope="module")
+def parsed_invalid_users(parser_services):
+    """Parse INVALID_USER_CSV once for the tests that only read the result."""
+    return parser_services["csv_user"].parse_content(INVALID_USER_CSV)
+
+
+@pytest.fixture(scope="module")
+def parsed_bools(parser_services):
+    """Parse BOOLEAN_USER_CSV once for the per-row boolean checks."""
+    return parser_services["csv_user"].parse_content(BOOLEAN_USER_CSV)
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    """Write the sample data files once for the file parsing tests."""
+    path = tmp_path_factory.mktemp("data")
+    (path / "users.csv").write_bytes(VALID_USER_CSV.replace("\n", "\r\n").encode("utf-8"))
+    (path / "users.json").write_bytes(VALID_USER_JSON.encode("utf-8"))
+    return path
+
+
+class TestParserService:
+    """Test DataParserService parsing."""
+
+    def test_parse_valid_csv(self, parser_services):
+        """Test parsing valid CSV content."""
+        service = parser_services["csv_user"]
+        result = service.parse_content(VALID_USER_CSV)
+
+        assert result.summary.total_records == 2
+        assert result.summary.valid_records == 2
+        assert result.data[0] == {
+            "id": 1,
+            "name": "John Doe",
+            "email": "john@example.com",
+            "age": 30,
+            "active": True,
+        }
+        assert result.data[1]["active"] is False
+
+    def test_parse_invalid_csv(self, parsed_invalid_users):
+        """Test that invalid CSV rows are reported and skipped."""
+        result = parsed_invalid_users
+
+        assert result.summary.valid_records == 1
+        assert result.summary.invalid_records == 3
+        errors = [(e.row_number, e.field) for e in result.summary.validation_errors]
+        assert errors == [(2, "id"), (3, "name"), (4, "email")]
+        assert result.summary.error_counts == {"id": 1, "name": 1, "email": 1}
+        by_field = result.summary.validation_errors_by_field
+        assert by_field["email"][0].message == "Invalid email format: not-an-email"
+
+    def test_parse_valid_json(self, parser_services):
+        """Test parsing valid JSON content."""
+        service = parser_services["json_user"]
+        result = service.parse_content(VALID_USER_JSON)
+
+        assert result.summary.valid_records == 2
+        assert result.data[0]["active"] is True
+        assert result.data[1]["id"] == 2
+        assert result.data[1]["active"] is False
+
+    def test_large_dataset_processing(self, parser_services):
+        """Test parsing a 100-record CSV."""
+        rows = ["id,name,email,age,active"]
+        rows.extend(
+            f"{i},User {i},user{i}@example.com,{20 + (i % 50)},true" for i in range(100)
+        )
+        large_csv = "\n".join(rows) + "\n"
+
+        result = parser_services["csv_user"].parse_content(large_csv)
+
+        assert result.summary.valid_records == 100
+        assert result.summary.invalid_records == 0
+        assert result.data[99] == {
+            "id": 99,
+            "name": "User 99",
+            "email": "user99@example.com",
+            "age": 69,
+            "active": True,
+        }
+
+    @pytest.mark.parametrize(
+        "data_format, content, total, second_id",
+        [
+            pytest.param(DataFormat.CSV, INVALID_USER_CSV, 4, "abc", id="csv"),
+            pytest.param(DataFormat.JSON, VALID_USER_JSON, 2, "2", id="json"),
+        ],
+    )
+    def test_parse_without_validation(self, data_format, content, total, second_id):
+        """Test that records are returned unconverted when validation is off."""
+        config = DataParserConfig(
+            format=data_format, schema=USER_SCHEMA.model_dump(), validate_on_parse=False
+        )
+
+        result = DataParserService(config).parse_content(content)
+
+        assert result.summary.total_records == total
+        assert result.summary.valid_records == total
+        assert result.summary.validation_errors == []
+        assert result.data[1]["id"] == second_id
+
+    def test_precompiled_fields(self):
+        """Test that passing precompiled fields parses like compiling per call."""
+        schema = USER_SCHEMA.model_dump()
+        fields = compile_json_fields(schema)
+
+        expected = parse_json_string(VALID_USER_JSON, schema)
+        result = parse_json_string(VALID_USER_JSON, schema, fields)
+
+        assert [field.name for field in fields] == list(schema["fields"])
+        assert result.data == expected.data
+
+    @pytest.mark.parametrize(
+        "service_name, content, expected_error",
+        [
+            pytest.param("json_user", "{invalid json}", "Invalid JSON", id="malformed-json"),
+            pytest.param(
+                "json_user", "[1]", "Invalid record type at row 1", id="json-non-object-record"
+            ),
+            pytest.param(
+                "csv_user", b"id,name\n1,\xff\n", "CSV parsing error", id="csv-invalid-utf8"
+            ),
+        ],
+    )
+    def test_parse_errors(self, parser_services, service_name, content, expected_error):
+        """Test that unparseable content is reported as a parse error."""
+        service = parser_services[service_name]
+        parse = service.parse_bytes if isinstance(content, bytes) else service.parse_content
+
+        result = parse(content)
+
+        assert result.data == []
+        assert result.summary.parse_errors[0].startswith(expected_error)
+
+    def test_parse_csv_bytes(self, parser_services):
+        """Test parsing CSV bytes matches parsing the decoded string."""
+        service = parser_services["csv_user"]
+        content = INVALID_USER_CSV.replace("John Doe", "Jöhn Doe")
+
+        result = service.parse_bytes(content.encode("utf-8"))
+        expected = service.parse_content(content)
+
+        assert result.data == expected.data
+        assert result.data[0]["name"] == "Jöhn Doe"
+        assert result.summary.validation_errors == expected.summary.validation_errors
+
+    def test_parse_json_bytes(self, parser_services):
+        """Test parsing JSON bytes."""
+        result = parser_services["json_user"].parse_bytes(VALID_USER_JSON.encode("utf-8"))
+
+        assert result.summary.valid_records == 2
+        assert result.data[1]["id"] == 2
+
+
+class TestBooleanConversion:
+    """Test CSV boolean conversion."""
+
+    @pytest.mark.parametrize(
+        "index, expected",
+        [(0, True), (1, False), (2, True), (3, False), (4, True)],
+        ids=["True", "FALSE", "1", "0", "empty-uses-default"],
+    )
+    def test_boolean_row(self, parsed_bools, index, expected):
+        """Test that each boolean spelling converts as expected."""
+        assert parsed_bools.data[index]["active"] is expected
+
+
+class TestParserServiceFiles:
+    """Test DataParserService file parsing."""
+
+    @pytest.mark.asyncio
+    async def test_parse_csv_file(self, parser_services, data_dir):
+        """Test parsing a CSV file with CRLF line endings."""
+        result = await parser_services["csv_user"].parse_file(str(data_dir / "users.csv"))
+
+        assert result.summary.valid_records == 2
+        assert result.data[1]["name"] == "Jane Smith"
+
+    @pytest.mark.asyncio
+    async def test_parse_json_file(self, parser_services, data_dir):
+        """Test parsing a JSON file."""
+        result = await parser_services["json_user"].parse_file(str(data_dir / "users.json"))
+
+        assert result.summary.valid_records == 2
+
+    @pytest.mark.asyncio
+    async def test_parse_large_json_file(self, parser_services, tmp_path):
+        """Test parsing a JSON file large enough to be memory-mapped."""
+        records = ",".join(
+            f'{{"id": {i}, "name": "User {i}", "email": "user{i}@example.com"}}'
+            for i in range(2000)
+        )
+        path = tmp_path / "users.json"
+        path.write_bytes(f"[{records}]".encode("utf-8"))
+        assert path.stat().st_size > 64 * 1024
+
+        result = await parser_services["json_user"].parse_file(str(path))
+
+        assert result.summary.valid_records == 2000
+        assert result.data[1999]["email"] == "user1999@example.com"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "min_total_bytes", [0, data_parser.PARALLEL_MIN_TOTAL_BYTES], ids=["pool", "serial"]
+    )
+    async def test_parse_files(self, parser_services, data_dir, monkeypatch, min_total_bytes):
+        """Test parsing several files, in order, with and without worker processes."""
+        monkeypatch.setattr(data_parser, "PARALLEL_MIN_TOTAL_BYTES", min_total_bytes)
+        paths = [str(data_dir / "users.csv"), str(data_dir / "missing.csv")]
+
+        results = await parser_services["csv_user"].parse_files(paths)
+
+        assert [result.summary.valid_records for result in results] == [2, 0]
+        assert results[1].errors == [f"File not found: {paths[1]}"]
+
+    @pytest.mark.asyncio
+    async def test_parse_undecodable_csv_file(self, parser_services, tmp_path):
+        """Test that a CSV file that is not UTF-8 is reported as a file error."""
+        path = tmp_path / "users.csv"
+        path.write_bytes(b"id,name\n1,\xff\n")
+
+        result = await parser_services["csv_user"].parse_file(str(path))
+
+        assert result.data == []
+        assert result.errors == result.summary.parse_errors
+        assert result.errors[0].startswith("'utf-8' codec can't decode")
+
+    @pytest.mark.asyncio
+    async def test_parse_missing_file(self, parser_services, data_dir):
+        """Test parsing a file that does not exist."""
+        path = data_dir / "missing.csv"
+
+        result = await parser_services["csv_user"].parse_file(str(path))
+
+        assert result.data == []
+        assert result.errors == [f"File not found: {path}"]
+
+
+class TestParserServiceCache:
+    """Test shared parser services."""
+
+    def test_service_is_cached(self):
+        """Test that services are built once per schema and format."""
+        csv_service = get_parser_service("user", DataFormat.CSV)
+
+        assert get_parser_service("user", DataFormat.CSV) is csv_service
+        assert get_parser_service("user", DataFormat.JSON) is not csv_service
+        assert csv_service.config.schema == USER_SCHEMA.model_dump()
+
+    def test_unknown_schema(self):
+        """Test requesting a service for an unknown schema."""
+        with pytest.raises(ValueError, match="not found"):
+            get_parser_service("unknown", DataFormat.CSV)
+
+    def test_built_config_matches_validated(self):
+        """Test that DataParserConfig.build equals a validated config."""
+        schema = USER_SCHEMA.model_dump()
+
+        built = DataParserConfig.build(format=DataFormat.JSON, schema=schema)
+
+        assert built == DataParserConfig(format=DataFormat.JSON, schema=schema)
+
+    def test_matches_uncached_service(self, parsed_invalid_users):
+        """Test that cached services parse like freshly built ones."""
+        config = DataParserConfig(format=DataFormat.CSV, schema=USER_SCHEMA.model_dump())
+
+        expected = DataParserService(config).parse_content(INVALID_USER_CSV)
+        result = parsed_invalid_users
+
+        assert result.data == expected.data
+        assert result.summary.validation_errors == expected.summary.validation_errors
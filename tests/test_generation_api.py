@@ -1,7 +1,9 @@
 """Integration tests for LDIF generation API."""
-import pytest
+import tempfile
+
 from fastapi.testclient import TestClient
 from app.main import app
+from app.routers import generation
 
 client = TestClient(app)
 
@@ -214,6 +216,41 @@ class TestCSVUpload:
         assert data["status"] == "pending"
         assert data["input_records"] == 2
 
+    def test_upload_csv_quoted_newlines(self):
+        """Test uploading CSV with CRLF endings and quoted multi-line fields."""
+        csv_content = b'id,name,note\r\n1,John,"line one\r\nline two"\r\n2,Jane,plain\r\n'
+
+        response = client.post(
+            "/api/v1/generation/upload/csv",
+            files={"file": ("test.csv", csv_content)},
+            data={"schema_name": "user"},
+        )
+        assert response.status_code == 200
+        assert response.json()["input_records"] == 2
+
+    def test_upload_csv_extra_cells(self):
+        """Test that rows with more cells than the header are rejected."""
+        response = client.post(
+            "/api/v1/generation/upload/csv",
+            files={"file": ("test.csv", b"uid,cn,sn\njdoe,John,Doe,EXTRA\n")},
+            data={"schema_name": "user"},
+        )
+        assert response.status_code == 400
+
+    def test_read_csv_records(self):
+        """Test reading CSV records from the temporary file behind an upload."""
+        with tempfile.SpooledTemporaryFile() as upload:
+            upload.write('id,name\r\n1,"Jöhn\r\nDoe"\r\n2,Döe'.encode("utf-8"))
+            upload.seek(0)
+
+            records = generation._read_csv_records(upload)
+
+            assert records == [
+                {"id": "1", "name": "Jöhn\r\nDoe"},
+                {"id": "2", "name": "Döe"},
+            ]
+            assert not upload.closed
+
     def test_upload_empty_csv(self):
         """Test uploading empty CSV."""
         csv_content = b""
@@ -291,6 +328,16 @@ class TestJSONUpload:
         )
         assert response.status_code == 400
 
+    def test_upload_blank_json(self):
+        """Test uploading a whitespace-only JSON file."""
+        response = client.post(
+            "/api/v1/generation/upload/json",
+            files={"file": ("test.json", b"  \n")},
+            data={"schema_name": "user"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "JSON file is empty"
+
     def test_upload_invalid_json(self):
         """Test uploading invalid JSON."""
         json_content = b'{invalid json}'
@@ -1,132 +1,282 @@
-import unittest
+"""Tests for LDIF generation."""
+import base64
+
+import pytest
+
 from app.services.ldif.models import User, Group, OU, LDAPEntry
 from app.services.ldif.generator import LDIFGenerator
+from app.services.ldif.emitter import emit_entry
+from app.services.ldif.utils import escape_dn_value
+
+# Expected base64 encodings of the UTF-8 bytes of " Test", "Jöhn" and "Döe".
+_B64_SPACE_TEST = base64.b64encode(" Test".encode("utf-8")).decode("ascii")
+_B64_JOHN_UTF8 = base64.b64encode("Jöhn".encode("utf-8")).decode("ascii")
+_B64_DOE_UTF8 = base64.b64encode("Döe".encode("utf-8")).decode("ascii")
+
+_USER_OBJECT_CLASSES = frozenset({"top", "person", "organizationalPerson", "inetOrgPerson"})
+_GROUP_OBJECT_CLASSES = frozenset({"top", "groupOfNames"})
+_OU_OBJECT_CLASSES = frozenset({"top", "organizationalUnit"})
+
+
+def make_user():
+    return User(uid="jdoe", parent_dn="ou=people,dc=example,dc=com", cn="John Doe", sn="Doe")
+
+
+def make_group():
+    return Group(
+        cn="admins",
+        parent_dn="ou=groups,dc=example,dc=com",
+        members=["uid=jdoe,ou=people,dc=example,dc=com"],
+    )
+
+
+def make_ou():
+    return OU(name="people", parent_dn="dc=example,dc=com")
+
+
+def make_batch():
+    return [
+        User(uid="u1", parent_dn="dc=x", cn="U1", sn="S1"),
+        User(uid="u2", parent_dn="dc=x", cn="U2", sn="S2"),
+    ]
+
+
+def make_mixed_batch():
+    return [
+        OU(name="dev", parent_dn="dc=x"),
+        User(uid="u1", parent_dn="ou=dev,dc=x", cn="U1", sn="S1"),
+        Group(cn="devs", parent_dn="ou=dev,dc=x", members=["uid=u1,ou=dev,dc=x"]),
+    ]
+
+
+def make_leading_space_user():
+    return User(uid="test", parent_dn="dc=x", cn=" Test", sn="Test")
+
+
+def make_utf8_user():
+    return User(uid="utf8", parent_dn="dc=x", cn="Jöhn", sn="Döe")
+
+
+def make_multi_valued_user():
+    return User(
+        uid="jdoe",
+        parent_dn="dc=x",
+        cn="John Doe",
+        sn="Doe",
+        additional_attributes={"mail": ["john@example.com", "jdoe@example.com"]},
+    )
+
+
+def make_escaped_user():
+    return User(uid="Smith, John", parent_dn="dc=x", cn="John Smith", sn="Smith")
+
+
+def make_escaped_group():
+    return Group(cn="#admins", parent_dn="dc=x")
+
+
+@pytest.fixture(scope="module")
+def entries():
+    """Build each sample entry once for the read-only tests in this module."""
+    factories = (
+        make_user,
+        make_group,
+        make_ou,
+        make_batch,
+        make_mixed_batch,
+        make_leading_space_user,
+        make_utf8_user,
+        make_multi_valued_user,
+        make_escaped_user,
+        make_escaped_group,
+    )
+    return {factory: factory() for factory in factories}
+
+
+def assert_all_in(text, lines):
+    """Assert that every expected line appears as a whole line of ``text``."""
+    missing = set(lines).difference(text.split("\n"))
+    assert not missing, f"missing lines: {sorted(missing)}"
+
+
+@pytest.mark.parametrize(
+    "factory, expected_lines",
+    [
+        pytest.param(
+            make_user,
+            [
+                "dn: uid=jdoe,ou=people,dc=example,dc=com",
+                "objectClass: top",
+                "objectClass: person",
+                "objectClass: organizationalPerson",
+                "objectClass: inetOrgPerson",
+                "uid: jdoe",
+                "cn: John Doe",
+                "sn: Doe",
+            ],
+            id="user",
+        ),
+        pytest.param(
+            make_group,
+            [
+                "dn: cn=admins,ou=groups,dc=example,dc=com",
+                "objectClass: top",
+                "objectClass: groupOfNames",
+                "cn: admins",
+                "member: uid=jdoe,ou=people,dc=example,dc=com",
+            ],
+            id="group",
+        ),
+        pytest.param(
+            make_ou,
+            [
+                "dn: ou=people,dc=example,dc=com",
+                "objectClass: organizationalUnit",
+                "ou: people",
+            ],
+            id="ou",
+        ),
+        pytest.param(
+            make_batch,
+            # The empty line separates the two entries.
+            ["dn: uid=u1,dc=x", "dn: uid=u2,dc=x", ""],
+            id="batch",
+        ),
+        pytest.param(
+            make_mixed_batch,
+            ["dn: ou=dev,dc=x", "dn: uid=u1,ou=dev,dc=x", "dn: cn=devs,ou=dev,dc=x"],
+            id="mixed-batch",
+        ),
+        pytest.param(
+            make_leading_space_user, [f"cn:: {_B64_SPACE_TEST}"], id="base64-leading-space"
+        ),
+        pytest.param(
+            make_utf8_user,
+            [f"cn:: {_B64_JOHN_UTF8}", f"sn:: {_B64_DOE_UTF8}"],
+            id="base64-non-ascii",
+        ),
+        pytest.param(
+            make_multi_valued_user,
+            ["mail: john@example.com", "mail: jdoe@example.com"],
+            id="multi-valued",
+        ),
+        pytest.param(make_escaped_user, ["dn: uid=Smith\\, John,dc=x"], id="dn-escaped-comma"),
+        pytest.param(make_escaped_group, ["dn: cn=\\#admins,dc=x"], id="dn-escaped-hash"),
+    ],
+)
+def test_contains_lines(render, entries, factory, expected_lines):
+    """Test that the generated LDIF contains the expected lines."""
+    assert_all_in(render(entries[factory]), expected_lines)
+
+
+def test_mixed_batch_entry_count(render, entries):
+    """Test that a mixed batch emits each entry exactly once."""
+    assert render(entries[make_mixed_batch]).count("dn:") == 3
+
+
+@pytest.mark.parametrize("n", [2, 1_000, pytest.param(10_000, marks=pytest.mark.perf)])
+def test_batch_scaling(n):
+    """Test that batches of any size emit one entry per input entry."""
+    entries = [User(uid=f"u{i}", parent_dn="dc=x", cn=f"U{i}", sn=f"S{i}") for i in range(n)]
+
+    # The entries are all ASCII, so count on the encoded bytes.
+    ldif = LDIFGenerator.generate(entries).encode("ascii")
+
+    assert ldif.count(b"dn:") == n
+    assert ldif.count(b"\n\n") == n - 1
+
+
+@pytest.mark.parametrize(
+    "factory, object_classes",
+    [
+        pytest.param(make_user, _USER_OBJECT_CLASSES, id="user"),
+        pytest.param(make_group, _GROUP_OBJECT_CLASSES, id="group"),
+        pytest.param(make_ou, _OU_OBJECT_CLASSES, id="ou"),
+    ],
+)
+def test_object_class_defaults(entries, factory, object_classes):
+    """Test that each entry type starts with its default object classes."""
+    assert object_classes.issubset(entries[factory].object_classes)
+
+
+@pytest.mark.parametrize(
+    "factory, rdn",
+    [
+        pytest.param(make_escaped_user, "uid=Smith\\, John", id="comma"),
+        pytest.param(make_escaped_group, "cn=\\#admins", id="hash"),
+    ],
+)
+def test_rdn_escaping(entries, factory, rdn):
+    """Test that special characters are escaped in RDNs."""
+    assert entries[factory].rdn == rdn
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (" a b ", "\\ a b\\ "),
+        (" ", "\\ "),
+        ("Jöhn", "J\\c3\\b6hn"),
+        ("a\tb", "a\\09b"),
+    ],
+)
+def test_dn_escaping_spaces_and_non_ascii(value, expected):
+    """Test escaping of surrounding spaces and non-printable characters."""
+    assert escape_dn_value(value) == expected
+
+
+def test_validation_error():
+    """Test that an entry whose DN is not key=value pairs is rejected."""
+    entry = LDAPEntry(rdn="invalid", parent_dn="", object_classes=[])
+
+    with pytest.raises(ValueError, match="Invalid DN: invalid"):
+        LDIFGenerator.generate(entry)
+
+
+def test_validation_skipped():
+    """Test that validation can be skipped for pre-validated entries."""
+    entry = LDAPEntry(rdn="invalid", parent_dn="", object_classes=[])
+
+    assert LDIFGenerator.generate(entry, validate=False) == "dn: invalid"
+
+
+def test_batch_validation_error():
+    """Test that one invalid entry fails the whole batch."""
+    user = User(uid="u1", parent_dn="dc=x", cn="U1", sn="S1")
+    entry = LDAPEntry(rdn="invalid", parent_dn="", object_classes=[])
+
+    with pytest.raises(ValueError, match="Invalid DN: invalid"):
+        LDIFGenerator.generate([user, entry])
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        pytest.param(
+            User(uid="jdoe", parent_dn="dc=x", cn=" John", sn="Döe",
+                 additional_attributes={"mail": ["john@example.com"]}),
+            id="user",
+        ),
+        pytest.param(Group(cn="admins", parent_dn="dc=x", members=["uid=jdoe,dc=x"]), id="group"),
+        pytest.param(OU(name="people", parent_dn="dc=x"), id="ou"),
+    ],
+)
+def test_specialized_emitter_matches_generic(entry):
+    """Test that per-class emitters produce the same lines as the generic one."""
+    assert type(entry)._ldif_emit is not LDAPEntry._ldif_emit
+
+    specialized, generic = [], []
+    type(entry)._ldif_emit(entry, specialized)
+    emit_entry(entry, generic)
+
+    assert specialized == generic
+
+
+def test_specialized_emitter_modified_object_classes():
+    """Test that entries with changed object classes fall back to generic output."""
+    user = User(uid="jdoe", parent_dn="dc=x", cn="John Doe", sn="Doe")
+    user.object_classes.append("posixAccount")
+
+    ldif = LDIFGenerator.generate(user)
 
-class TestLDIFGenerator(unittest.TestCase):
-
-    def test_user_generation(self):
-        user = User(uid="jdoe", parent_dn="ou=people,dc=example,dc=com", cn="John Doe", sn="Doe")
-        ldif = LDIFGenerator.generate(user)
-        
-        expected_lines = [
-            "dn: uid=jdoe,ou=people,dc=example,dc=com",
-            "objectClass: top",
-            "objectClass: person",
-            "objectClass: organizationalPerson",
-            "objectClass: inetOrgPerson",
-            "uid: jdoe",
-            "cn: John Doe",
-            "sn: Doe"
-        ]
-        
-        for line in expected_lines:
-            self.assertIn(line, ldif)
-
-    def test_group_generation(self):
-        group = Group(cn="admins", parent_dn="ou=groups,dc=example,dc=com", members=["uid=jdoe,ou=people,dc=example,dc=com"])
-        ldif = LDIFGenerator.generate(group)
-        
-        expected_lines = [
-            "dn: cn=admins,ou=groups,dc=example,dc=com",
-            "objectClass: top",
-            "objectClass: groupOfNames",
-            "cn: admins",
-            "member: uid=jdoe,ou=people,dc=example,dc=com"
-        ]
-        
-        for line in expected_lines:
-            self.assertIn(line, ldif)
-
-    def test_ou_generation(self):
-        ou = OU(name="people", parent_dn="dc=example,dc=com")
-        ldif = LDIFGenerator.generate(ou)
-        
-        self.assertIn("dn: ou=people,dc=example,dc=com", ldif)
-        self.assertIn("objectClass: organizationalUnit", ldif)
-        self.assertIn("ou: people", ldif)
-
-    def test_batch_generation(self):
-        user1 = User(uid="u1", parent_dn="dc=x", cn="U1", sn="S1")
-        user2 = User(uid="u2", parent_dn="dc=x", cn="U2", sn="S2")
-        
-        ldif = LDIFGenerator.generate([user1, user2])
-        
-        self.assertIn("dn: uid=u1,dc=x", ldif)
-        self.assertIn("dn: uid=u2,dc=x", ldif)
-        self.assertEqual(ldif.count("dn:"), 2)
-        # Check separation by empty line
-        self.assertIn("\n\n", ldif)
-
-    def test_mixed_batch(self):
-        ou = OU(name="dev", parent_dn="dc=x")
-        user = User(uid="u1", parent_dn="ou=dev,dc=x", cn="U1", sn="S1")
-        group = Group(cn="devs", parent_dn="ou=dev,dc=x", members=["uid=u1,ou=dev,dc=x"])
-        
-        ldif = LDIFGenerator.generate([ou, user, group])
-        
-        self.assertIn("dn: ou=dev,dc=x", ldif)
-        self.assertIn("dn: uid=u1,ou=dev,dc=x", ldif)
-        self.assertIn("dn: cn=devs,ou=dev,dc=x", ldif)
-        self.assertEqual(ldif.count("dn:"), 3)
-
-    def test_base64_encoding(self):
-        # Attribute starting with space
-        user = User(uid="test", parent_dn="dc=x", cn=" Test", sn="Test")
-        ldif = LDIFGenerator.generate(user)
-        
-        # " Test" in base64 is "IFRlc3Q="
-        self.assertIn("cn:: IFRlc3Q=", ldif)
-        
-        # Attribute with non-ascii
-        user_utf8 = User(uid="utf8", parent_dn="dc=x", cn="Jöhn", sn="Döe")
-        ldif = LDIFGenerator.generate(user_utf8)
-        
-        # Jöhn in base64: Siwobm
-        # Döe in base64: RMO2ZQ==
-        # Note: base64 encoding depends on utf-8 bytes.
-        import base64
-        cn_b64 = base64.b64encode("Jöhn".encode("utf-8")).decode("ascii")
-        self.assertIn(f"cn:: {cn_b64}", ldif)
-
-    def test_validation_error(self):
-        # Invalid DN char (comma is allowed as separator, but let's say we have a messed up DN structure)
-        # Our validator is simple: checks for key=value pairs.
-        # "invalid" is not key=value
-        
-        # We manually construct LDAPEntry to bypass User constructor checks if any (User constructor forces structure)
-        entry = LDAPEntry(rdn="invalid", parent_dn="", object_classes=[])
-        
-        with self.assertRaises(ValueError):
-            LDIFGenerator.generate(entry)
-
-    def test_multi_valued_attributes(self):
-        user = User(uid="jdoe", parent_dn="dc=x", cn="John Doe", sn="Doe", 
-                   additional_attributes={"mail": ["john@example.com", "jdoe@example.com"]})
-        
-        ldif = LDIFGenerator.generate(user)
-        self.assertIn("mail: john@example.com", ldif)
-        self.assertIn("mail: jdoe@example.com", ldif)
-
-    def test_dn_escaping(self):
-        # User with special chars in UID
-        # Special chars: , + " \ < > ;
-        uid = "Smith, John"
-        user = User(uid=uid, parent_dn="dc=x", cn="John Smith", sn="Smith")
-        
-        # RDN should be uid=Smith\, John
-        self.assertEqual(user.rdn, "uid=Smith\\, John")
-        
-        ldif = LDIFGenerator.generate(user)
-        # DN should be escaped
-        self.assertIn("dn: uid=Smith\\, John,dc=x", ldif)
-        
-        # Another case
-        group = Group(cn="#admins", parent_dn="dc=x")
-        # RDN should be cn=\#admins
-        self.assertEqual(group.rdn, "cn=\\#admins")
-        
-        ldif_group = LDIFGenerator.generate(group)
-        self.assertIn("dn: cn=\\#admins,dc=x", ldif_group)
-
-if __name__ == '__main__':
-    unittest.main()
+    assert "objectClass: inetOrgPerson\nobjectClass: posixAccount" in ldif
@@ -1,28 +1,33 @@
 """Tests for the main application."""
+import pytest
 
 
-def test_root_endpoint(client):
+@pytest.mark.asyncio
+async def test_root_endpoint(client):
     """Test the root endpoint."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Welcome to FastAPI service"}
 
 
-def test_health_check(client):
+@pytest.mark.asyncio
+async def test_health_check(client):
     """Test the health check endpoint."""
-    response = client.get("/api/v1/health")
+    response = await client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
 
-def test_readiness_check(client):
+@pytest.mark.asyncio
+async def test_readiness_check(client):
     """Test the readiness check endpoint."""
-    response = client.get("/api/v1/ready")
+    response = await client.get("/api/v1/ready")
     assert response.status_code == 200
     assert response.json() == {"status": "ready"}
 
 
-def test_nonexistent_endpoint(client):
+@pytest.mark.asyncio
+async def test_nonexistent_endpoint(client):
     """Test that a nonexistent endpoint returns 404."""
-    response = client.get("/nonexistent")
+    response = await client.get("/nonexistent")
     assert response.status_code == 404